@@ -24,6 +24,19 @@ DIRECTIONS = [
 
 # Pre-computed conversions
 TEXT_TO_NUM     = {entry["text"]:   entry["num"]    for entry in DIRECTIONS}
+
+# Direction text with optional vertical suffix ("northup", "southdown", …)
+# resolved in a single lookup, no suffix stripping needed
+SUFFIXED_TEXT_TO_NUM = {
+    entry["text"] + suffix: entry["num"]
+    for entry in DIRECTIONS
+    for suffix in ("", "up", "down")
+}
+SUFFIXED_TEXT_TO_DELTA = {
+    entry["text"] + suffix: entry["delta"]
+    for entry in DIRECTIONS
+    for suffix in ("", "up", "down")
+}
 NUM_TO_DELTA    = {entry["num"]:    entry["delta"]  for entry in DIRECTIONS}
 TEXT_TO_DELTA   = {entry["text"]:   entry["delta"]  for entry in DIRECTIONS}
 DELTA_TO_TEXT   = {entry["delta"]:  entry["text"]   for entry in DIRECTIONS}
\ No newline at end of file
@@ -12,6 +12,14 @@ import shiboken6
 class MapController(QObject):
     mapUpdated = Signal()
 
+    # Every GMCP event funnels through this object; slot descriptors make the
+    # hot self.* reads bypass the instance dict.
+    __slots__ = (
+        "map", "state", "layout", "renderer",
+        "_save_timer", "_pending_infos", "_prev_info", "_render_timer",
+        "_last_layout_sig",
+    )
+
     def __init__(self, mapper_widget, profile_path=None):
         super().__init__()
         self.map = mapper_widget
@@ -22,16 +30,25 @@ class MapController(QObject):
         self._save_timer = QTimer(self, singleShot=True)
         self._save_timer.timeout.connect(self.state.save_map)
 
-        self.map.horizontalScrollBar().valueChanged.connect(self.render)
-        self.map.verticalScrollBar().valueChanged.connect(self.render)
+        # GMCP room infos queued here and flushed once per event-loop tick
+        self._pending_infos = []
+        self._prev_info = None
+        self._last_layout_sig = None
+
+        # Scroll/resize can fire many times per frame; coalesce to ~60 Hz
+        self._render_timer = QTimer(self, singleShot=True, interval=16)
+        self._render_timer.timeout.connect(self.render)
+
+        self.map.horizontalScrollBar().valueChanged.connect(self.schedule_render)
+        self.map.verticalScrollBar().valueChanged.connect(self.schedule_render)
         self.map.viewport().installEventFilter(self)
 
     def cleanup(self):
         try:
             if self.map and self.map.viewport():
                 self.map.viewport().removeEventFilter(self)
-            self.map.horizontalScrollBar().valueChanged.disconnect(self.render)
-            self.map.verticalScrollBar().valueChanged.disconnect(self.render)
+            self.map.horizontalScrollBar().valueChanged.disconnect(self.schedule_render)
+            self.map.verticalScrollBar().valueChanged.disconnect(self.schedule_render)
         except (AttributeError, RuntimeError):
             pass
 
@@ -41,16 +58,17 @@ class MapController(QObject):
     def schedule_save(self):
         self._save_timer.start(1000)
 
+    def schedule_render(self):
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
     def eventFilter(self, obj, event):
         if not shiboken6.isValid(self.map):
             return False
 
         viewport = self.map.viewport()
         if shiboken6.isValid(viewport) and obj == viewport and event.type() == QEvent.Resize:
-            try:
-                self.render()
-            except RuntimeError:
-                pass
+            self.schedule_render()
         return super().eventFilter(obj, event)
 
     def on_room_info(self, info: dict):
@@ -58,15 +76,62 @@ class MapController(QObject):
         if not room_hash:
             return
 
-        self.state.update_links_before_change()
-        self.state.add_or_update_room(info)
-        self.layout.build_local_area(self.state.local_graph, room_hash)
+        # GMCP re-sends Room.Info for the current room on look/idle/prompt;
+        # skip these idempotent repeats outright
+        prev = self._prev_info
+        if (prev is not None
+                and room_hash == self.state.current_room
+                and info.get("links") == prev.get("links")
+                and info.get("exits") == prev.get("exits")
+                and info.get("type") == prev.get("type")
+                and info.get("short") == prev.get("short")):
+            self._prev_info = info
+            return
+        self._prev_info = info
+
+        # Coalesce bursts (e.g. speedwalking) into one layout/render pass
+        self._pending_infos.append(info)
+        if len(self._pending_infos) == 1:
+            QTimer.singleShot(0, self._flush_room_infos)
+
+    def _flush_room_infos(self):
+        infos, self._pending_infos = self._pending_infos, []
+        if not infos or self.map is None:
+            return
+
+        # The graph version only tracks topology, so watch for desc/terrain
+        # changes ourselves — they repaint icons without bumping the version
+        visual_changed = False
+        for info in infos:
+            self.state.update_links_before_change()
+            room = self.state.global_graph.get_room(info["hash"])
+            if room is not None and (
+                    room.desc != info.get("short", room.desc)
+                    or room.terrain != info.get("type", room.terrain)):
+                visual_changed = True
+            self.state.add_or_update_room(info)
+
+        room_hash = infos[-1]["hash"]
+
+        # Same room, same topology, same visuals → layout and scene are
+        # still valid; just re-aim the marker.
+        sig = (room_hash, self.state.global_graph.version)
+        if sig == self._last_layout_sig and not visual_changed:
+            self.renderer.update_marker(room_hash, self.state.get_move_code(room_hash))
+            return
+        self._last_layout_sig = sig
+
+        self.layout.build_local_area(room_hash)
         self.renderer.update_marker(room_hash, self.state.get_move_code(room_hash))
         self.render()
         self.mapUpdated.emit()
         self.schedule_save()
 
     def render(self):
+        # Deliberately does not emit mapUpdated: scroll/resize-driven renders
+        # change what is visible, not the map data. Data changes emit from
+        # their own call sites.
+        if self.map is None:
+            return
         self.layout.update_positions(self.state.current_room)
         self.renderer.render(self.state.current_room, self.layout.local_positions)
-        self.mapUpdated.emit()
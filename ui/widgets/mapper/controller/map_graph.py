@@ -2,36 +2,86 @@
 
 import collections
 import pickle
+import sys
 from pathlib import Path
 
-import networkx as nx
-
-from ui.widgets.mapper.constants import TEXT_TO_DELTA
 from ui.widgets.mapper.controller.room import Room
 
 
-def _strip_vertical_suffix(direction: str) -> str:
-    direction = direction.lower()
-    if direction.endswith("up"):
-        return direction[:-2]
-    if direction.endswith("down"):
-        return direction[:-4]
-    return direction
-
-
-class MapGraph(nx.Graph):
+class MapGraph:
     """
-    A graph of Room instances. Nodes keyed by room.hash.
+    A graph of Room instances keyed by room.hash, backed by plain dicts.
+    (networkx used to hold this, but none of its algorithms were used and
+    its per-call adjacency/view overhead showed up in the hot paths.)
     Edges may include:
       - 'border'   (bool): prevents traversal
       - 'door'     (str): "open", "closed", or None
       - 'exit_val' (int): raw GMCP exit type (100=road, 104=path, 101=open door, -101=closed door, etc.)
+    Edge attribute dicts are shared between both directions.
     """
 
+    def __init__(self):
+        self._rooms: dict[str, Room] = {}
+        self._adj: dict[str, dict[str, dict]] = {}
+        self._version = 0
+        self._layout_cache = None  # (root_hash, version, positions)
+
+    def __setstate__(self, state):
+        if "_node" in state and "_rooms" not in state:
+            # Map pickled by the earlier networkx-backed implementation:
+            # translate its node/adjacency dicts (same nested shape).
+            self._rooms = {
+                h: attrs["room"]
+                for h, attrs in state["_node"].items()
+                if attrs.get("room") is not None
+            }
+            self._adj = {h: dict(nbrs) for h, nbrs in state.get("_adj", {}).items()}
+            self._version = 0
+            self._layout_cache = None
+        else:
+            self.__dict__.update(state)
+            self.__dict__.setdefault("_version", 0)
+            self.__dict__.setdefault("_layout_cache", None)
+
+    def __contains__(self, room_hash) -> bool:
+        return room_hash in self._rooms
+
+    def __getitem__(self, room_hash) -> dict:
+        return self._adj[room_hash]
+
+    @property
+    def adj(self) -> dict:
+        return self._adj
+
+    @property
+    def version(self) -> int:
+        """Topology version; bumps on every mutation. Cheap change detector
+        for callers caching anything derived from the graph."""
+        return self._version
+
+    def edges(self):
+        """Yields each (a, b) edge exactly once."""
+        for a, neighbours in self._adj.items():
+            for b in neighbours:
+                if a < b:
+                    yield a, b
+
+    def clear(self):
+        self._rooms.clear()
+        self._adj.clear()
+        self._bump_version()
+
+    def _bump_version(self):
+        """Invalidates cached layouts after any topology change."""
+        self._version += 1
+        self._layout_cache = None
+
     def add_room(self, room: Room):
-        if room.hash and room.hash not in self.nodes:
-            self.add_node(room.hash, room=room)
+        if room.hash and room.hash not in self._rooms:
+            self._rooms[room.hash] = room
+            self._adj.setdefault(room.hash, {})
             room.graph_ref = self
+            self._bump_version()
 
     def add_or_update_room(
         self,
@@ -42,14 +92,22 @@ class MapGraph(nx.Graph):
         room_hash = info.get("hash")
         if not room_hash:
             return
+        # Interned hashes compare by pointer in every dict/set the mapper
+        # keys by room — positions, adjacency, icons
+        room_hash = sys.intern(room_hash)
 
         # Update or create the Room node
-        existing_node = self.nodes.get(room_hash, {})
-        room = existing_node.get("room")
+        room = self._rooms.get(room_hash)
         if room:
             room.desc = info.get("short", room.desc)
             room.terrain = info.get("type", room.terrain)
-            room.links = info.get("links", room.links)
+            new_links = info.get("links", room.links)
+            if new_links != room.links:
+                room.links = new_links
+                room._non_cardinal_tags = None
+                room._links_rev = None
+                room._layout_exits = None
+                self._bump_version()
         else:
             room = Room(info)
             self.add_room(room)
@@ -58,8 +116,9 @@ class MapGraph(nx.Graph):
         for dir_txt, dest_hash in (room.links or {}).items():
             if not dest_hash:
                 continue
+            dest_hash = sys.intern(dest_hash)
             # Ensure the neighbor node exists
-            if dest_hash not in self.nodes:
+            if dest_hash not in self._rooms:
                 self.add_room(Room({"hash": dest_hash}))
 
             # Retrieve existing edge data, if any
@@ -95,11 +154,20 @@ class MapGraph(nx.Graph):
             )
 
     def has_room(self, room_hash: str) -> bool:
-        return room_hash in self.nodes
+        return room_hash in self._rooms
 
     def get_room(self, room_hash: str) -> Room | None:
-        node = self.nodes.get(room_hash, {})
-        return node.get("room")
+        return self._rooms.get(room_hash)
+
+    def has_edge(self, a: str, b: str) -> bool:
+        neighbours = self._adj.get(a)
+        return neighbours is not None and b in neighbours
+
+    def get_edge_data(self, a: str, b: str, default=None):
+        neighbours = self._adj.get(a)
+        if neighbours is None:
+            return default
+        return neighbours.get(b, default)
 
     def connect_rooms(
         self,
@@ -115,13 +183,23 @@ class MapGraph(nx.Graph):
           - optional door state
           - optional exit_val for roads/paths/doors
         """
-        if src in self.nodes and dst in self.nodes:
+        if src in self._rooms and dst in self._rooms:
             attrs: dict[str, object] = {"border": border}
             if door is not None:
                 attrs["door"] = door
             if exit_val is not None:
                 attrs["exit_val"] = exit_val
-            self.add_edge(src, dst, **attrs)
+
+            existing = self._adj[src].get(dst)
+            if existing is not None:
+                if all(existing.get(k) == v for k, v in attrs.items()):
+                    return  # no change, keep cached layouts valid
+                existing.update(attrs)
+            else:
+                # One shared dict for both directions
+                self._adj[src][dst] = attrs
+                self._adj[dst][src] = attrs
+            self._bump_version()
 
     def set_border(self, a: str, b: str, border: bool = True):
         if self.has_edge(a, b):
@@ -132,42 +210,77 @@ class MapGraph(nx.Graph):
             self.connect_rooms(a, b, border=border, door=door, exit_val=exit_val)
 
     def is_border(self, a: str, b: str) -> bool:
-        return self.has_edge(a, b) and self[a][b].get("border", False)
+        edge = self.get_edge_data(a, b)
+        return bool(edge) and edge.get("border", False)
+
+    def remove_node(self, room_hash: str):
+        for neighbour in self._adj.pop(room_hash, {}):
+            del self._adj[neighbour][room_hash]
+        self._rooms.pop(room_hash, None)
+        self._bump_version()
 
     def layout_from_root(self, root_hash: str) -> dict[str, tuple[int, int]]:
-        if root_hash not in self.nodes:
+        if root_hash not in self._rooms:
             return {}
 
+        cache = self._layout_cache
+        if cache and cache[1] == self._version:
+            if cache[0] == root_hash:
+                return cache[2]
+            base = cache[2]
+            if root_hash in base:
+                # Topology unchanged and the new root sits inside the cached
+                # component: translating the cached layout gives an equally
+                # valid, collision-free placement without re-walking every
+                # room and edge. Typical case: moving to an adjacent room.
+                dx, dy = base[root_hash]
+                positions = {h: (x - dx, y - dy) for h, (x, y) in base.items()}
+                rooms = self._rooms
+                for h, (x, y) in positions.items():
+                    room = rooms[h]
+                    room.grid_x, room.grid_y = x, y
+                self._layout_cache = (root_hash, self._version, positions)
+                return positions
+
         positions: dict[str, tuple[int, int]] = {root_hash: (0, 0)}
         coord_owner: dict[tuple[int, int], str] = {(0, 0): root_hash}
         queue = collections.deque([root_hash])
 
+        # Locals for the hot loop: LOAD_FAST instead of attribute walks
+        rooms = self._rooms
+        adj = self._adj
+        popleft = queue.popleft
+        push = queue.append
+
         while queue:
-            current = queue.popleft()
+            current = popleft()
             x, y = positions[current]
-            room = self.get_room(current)
+            room = rooms[current]
             room.grid_x, room.grid_y = x, y
+            edges = adj[current]
 
-            for dir_txt, neighbour in (room.links or {}).items():
-                if not neighbour or neighbour not in self.nodes:
+            for neighbour, dx, dy in room.layout_exits:
+                if neighbour not in rooms:
                     continue
-                if self.is_border(current, neighbour):
+                # Inline border test: is_border() would redo the adjacency
+                # walk per neighbour on the hottest loop in the mapper
+                edge = edges.get(neighbour)
+                if edge is not None and edge.get("border"):
                     continue
 
-                delta = TEXT_TO_DELTA.get(_strip_vertical_suffix(dir_txt))
-                if not delta:
-                    continue
-
-                neighbour_x, neighbour_y = x + delta[0], y + delta[1]
                 if neighbour in positions:
                     continue
-                if coord_owner.get((neighbour_x, neighbour_y), neighbour) != neighbour:
+
+                target = (x + dx, y + dy)
+                # setdefault claims the cell and reports any previous owner
+                # in a single hash traversal
+                if coord_owner.setdefault(target, neighbour) != neighbour:
                     continue
 
-                positions[neighbour] = (neighbour_x, neighbour_y)
-                coord_owner[(neighbour_x, neighbour_y)] = neighbour
-                queue.append(neighbour)
+                positions[neighbour] = target
+                push(neighbour)
 
+        self._layout_cache = (root_hash, self._version, positions)
         return positions
 
     def save_to_file(self, path: str | Path):
@@ -177,4 +290,4 @@ class MapGraph(nx.Graph):
     @staticmethod
     def load_from_file(path: str | Path) -> "MapGraph":
         with open(path, "rb") as f:
-            return pickle.load(f)
\ No newline at end of file
+            return pickle.load(f)
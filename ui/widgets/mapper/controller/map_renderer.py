@@ -1,10 +1,8 @@
 # ui/widgets/mapper/controller/map_renderer.py
 
-from collections import Counter
 from PySide6.QtCore import QRectF, QPointF
-from PySide6.QtWidgets import QGraphicsRectItem
 
-from ui.widgets.mapper.constants import GRID_SIZE, TEXT_TO_NUM, NUM_TO_DELTA
+from ui.widgets.mapper.constants import GRID_SIZE, SUFFIXED_TEXT_TO_NUM, NUM_TO_DELTA
 from ui.widgets.mapper.graphics.room_icon import RoomIcon
 from ui.widgets.mapper.graphics.cardinal_direction_connector import CardinalDirectionConnector
 from ui.widgets.mapper.graphics.non_cardinal_direction_connector import NonCardinalDirectionConnector
@@ -21,60 +19,140 @@ class MapRenderer:
         self._marker = None
         self._icons = {}
         self._connectors = {}
-        self._drawn_edges = set()
-        self._tags = []
-        self._borders = []
-        self._anchors = []
+        self._tags = {}
+        self._last_positions = {}
+
+        # Oversized scene rect so panning works without placing anchor items.
+        distance = self.ANCHOR_DISTANCE
+        self.map.scene().setSceneRect(
+            -distance, -distance, 2 * distance, 2 * distance
+        )
 
     def render(self, root_hash, positions):
         scene = self.map.scene()
 
-        self._clear_scene()
         if not root_hash:
+            self._clear_scene()
             return
 
         view_rect = self._get_view_rect()
 
-        # 🧱 Add room icons
-        for room_hash, (gx, gy) in positions.items():
-            icon_rect = QRectF(gx * GRID_SIZE, gy * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            if view_rect.intersects(icon_rect):
+        # Hoist hot lookups out of the per-item loops
+        icons = self._icons
+        connectors = self._connectors
+        graph = self.state.global_graph
+        edge_key = self._edge_key
+        intersects = view_rect.intersects
+        remove_item = scene.removeItem
+
+        # 🧱 Diff room icons: keep survivors, drop the rest, add newcomers
+        desired_icons = {
+            room_hash: (gx, gy)
+            for room_hash, (gx, gy) in positions.items()
+            if intersects(QRectF(gx * GRID_SIZE, gy * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+        }
+
+        removed = set(icons) - desired_icons.keys()
+        for room_hash in removed:
+            remove_item(icons.pop(room_hash))
+            tag = self._tags.pop(room_hash, None)
+            if tag:
+                remove_item(tag)
+
+        if removed:
+            # Connectors referencing a removed icon must go with it
+            for key, conn in list(connectors.items()):
+                if (getattr(conn.icon_a, "room_hash", None) in removed
+                        or getattr(conn.icon_b, "room_hash", None) in removed):
+                    remove_item(conn)
+                    del connectors[key]
+
+        last_positions = self._last_positions
+        moved = {
+            room_hash for room_hash, pos in desired_icons.items()
+            if last_positions.get(room_hash) != pos
+        }
+
+        for room_hash, (gx, gy) in desired_icons.items():
+            icon = icons.get(room_hash)
+            if icon is None:
                 self._add_icon(scene, room_hash, gx, gy)
-
-        # 🔗 Add connectors
-        for a, b in self.state.global_graph.edges():
-            key = frozenset((a, b))
-            if key in self._drawn_edges:
+            else:
+                self._update_icon(scene, icon, room_hash, gx, gy)
+
+        # 🔗 Diff connectors against the edges that should be visible.
+        # Every drawable edge touches at least one visible icon, so walking
+        # the adjacency of visible rooms beats scanning every global edge.
+        adjacency = graph.adj
+        is_border_fn = graph.is_border
+
+        # Icons are top-level items, so their scene position is just the grid
+        # cell scaled; computing it here avoids a scenePos() transform walk
+        # per edge.
+        scene_pts = {
+            room_hash: QPointF(gx * GRID_SIZE, gy * GRID_SIZE)
+            for room_hash, (gx, gy) in desired_icons.items()
+        }
+
+        desired_edges = {}
+        for a in icons:
+            if a not in adjacency:
                 continue
-
-            icon_a, icon_b = self._icons.get(a), self._icons.get(b)
-            attrs = self.state.global_graph[a][b]
-            is_border = self.state.global_graph.is_border(a, b)
+            pt_a = scene_pts[a]
+            for b in adjacency[a]:
+                key = edge_key(a, b)
+                if key in desired_edges:
+                    continue
+
+                if b in icons:
+                    if intersects(
+                            QRectF(pt_a, scene_pts[b]).normalized().adjusted(-1, -1, 1, 1)):
+                        desired_edges[key] = (a, b)
+                elif is_border_fn(a, b):
+                    if intersects(QRectF(pt_a.x(), pt_a.y(), GRID_SIZE, GRID_SIZE)):
+                        desired_edges[key] = (a, b)
+
+        for key in set(connectors) - desired_edges.keys():
+            remove_item(connectors.pop(key))
+
+        for key, (a, b) in desired_edges.items():
+            icon_a, icon_b = icons.get(a), icons.get(b)
+
+            if icon_a and icon_b and self._is_multi_exit(a, b):
+                self._add_exit_vector(a, b, positions)
+
+            # One shared attr dict per edge — fetch it once instead of
+            # resolving graph[a][b] for border and exit_val separately
+            attrs = adjacency[a][b]
+            is_border = attrs.get("border", False)
             exit_val = attrs.get("exit_val")
-            conn = None
+
+            conn = connectors.get(key)
+            if conn is not None:
+                if conn.border == is_border and conn.exit_val == exit_val:
+                    # endpoints unchanged → geometry is still valid
+                    if a in moved or b in moved:
+                        conn.refresh()
+                    continue
+                # style changed (border toggled, door state, …) — rebuild
+                remove_item(conn)
+                del connectors[key]
 
             if icon_a and icon_b:
-                if view_rect.intersects(
-                        QRectF(icon_a.scenePos(), icon_b.scenePos()).normalized().adjusted(-1, -1, 1, 1)):
-                    if self._is_multi_exit(a, b):
-                        self._add_exit_vector(a, b, positions)
-                    conn = CardinalDirectionConnector(icon_a, icon_b, border=is_border, exit_val=exit_val)
-            elif is_border and (icon := icon_a or icon_b):
-                if view_rect.intersects(icon.sceneBoundingRect()):
-                    conn = self._create_border_arrow(a, b, positions)
+                conn = CardinalDirectionConnector(icon_a, icon_b, border=is_border, exit_val=exit_val)
+            else:
+                conn = self._create_border_arrow(a, b, positions)
 
             if conn:
                 conn.add_to_scene(scene)
-                self._connectors[key] = conn
-                self._drawn_edges.add(key)
+                connectors[key] = conn
 
-        self._add_pan_anchors()
+        self._last_positions = desired_icons
 
     def update_marker(self, room_hash, move_code):
         x, y = self.state.global_graph.layout_from_root(room_hash).get(room_hash, (0, 0))
         if self._marker:
-            self._marker.update_position(x, y)
-            self._marker.update_direction(move_code)
+            self._marker.update_state(x, y, move_code)
         else:
             self._marker = LocationWidget(x, y, direction_code=move_code)
             self.map.scene().addItem(self._marker)
@@ -84,21 +162,24 @@ class MapRenderer:
     def get_connectors(self):
         return self._connectors
 
+    @staticmethod
+    def _edge_key(a, b):
+        # Plain sorted tuple: far cheaper to build and hash than a frozenset
+        return (a, b) if a < b else (b, a)
+
     def _get_view_rect(self):
         return self.map.mapToScene(self.map.viewport().rect()).boundingRect().adjusted(-GRID_SIZE, -GRID_SIZE, GRID_SIZE, GRID_SIZE)
 
     def _clear_scene(self):
         scene = self.map.scene()
-        for group in (self._icons.values(), self._connectors.values(), self._tags, self._borders, self._anchors):
+        for group in (self._icons.values(), self._connectors.values(), self._tags.values()):
             for item in group:
                 scene.removeItem(item)
 
         self._icons.clear()
         self._connectors.clear()
         self._tags.clear()
-        self._borders.clear()
-        self._drawn_edges.clear()
-        self._anchors.clear()
+        self._last_positions = {}
 
     def _add_icon(self, scene, room_hash, gx, gy):
         room = self.state.global_graph.get_room(room_hash)
@@ -107,18 +188,53 @@ class MapRenderer:
         scene.addItem(icon)
         self._icons[room_hash] = icon
 
-        tags = [d.lower() for d in room.links if d.lower() in ("in", "out", "up", "down")]
+        tags = room.non_cardinal_tags
         if tags:
             tag = NonCardinalDirectionConnector(icon, tags)
             scene.addItem(tag)
-            self._tags.append(tag)
+            self._tags[room_hash] = tag
+
+    def _update_icon(self, scene, icon, room_hash, gx, gy):
+        """Re-syncs a surviving icon in place instead of recreating it."""
+        moved = (icon.grid_x, icon.grid_y) != (gx, gy)
+        if moved:
+            icon.grid_x, icon.grid_y = gx, gy
+            icon.setPos(QPointF(gx * GRID_SIZE, gy * GRID_SIZE))
+
+        icon.reset_exit_vectors()
+
+        room = self.state.global_graph.get_room(room_hash)
+        if icon.toolTip() != room.desc:
+            icon.setToolTip(room.desc)
+        if icon.terrain != room.terrain:
+            icon.terrain = room.terrain
+            icon.update()
+
+        tags = room.non_cardinal_tags
+        old_tag = self._tags.get(room_hash)
+        if moved or (old_tag.directions if old_tag else ()) != tags:
+            if old_tag:
+                scene.removeItem(old_tag)
+                del self._tags[room_hash]
+            if tags:
+                tag = NonCardinalDirectionConnector(icon, tags)
+                scene.addItem(tag)
+                self._tags[room_hash] = tag
 
     def _is_multi_exit(self, a, b):
         room = self.state.global_graph.get_room(a)
-        directions = [split_suffix(d)[0] for d in room.links]
-        count = Counter(directions)
-        direction = next((d for d, dst in room.links.items() if dst == b), None)
-        return count[split_suffix(direction)[0]] > 1 if direction else False
+        direction = room.links_rev.get(b)
+        if not direction:
+            return False
+
+        base = split_suffix(direction)[0]
+        seen = False
+        for d in room.links:
+            if split_suffix(d)[0] == base:
+                if seen:
+                    return True
+                seen = True
+        return False
 
     def _add_exit_vector(self, a, b, positions):
         ax, ay = positions[a]
@@ -141,28 +257,9 @@ class MapRenderer:
         if other in self._icons:
             return CardinalDirectionConnector(icon, self._icons[other], border=True, exit_val=exit_val)
 
-        dir_txt = next((d for d, dst in self.state.global_graph.get_room(anchor).links.items() if dst == other), "")
-        code = TEXT_TO_NUM.get(split_suffix(dir_txt)[0], 8)
+        dir_txt = self.state.global_graph.get_room(anchor).links_rev.get(other, "")
+        code = SUFFIXED_TEXT_TO_NUM.get(dir_txt.lower(), 8)
         dx, dy = NUM_TO_DELTA.get(code, (0, -1))
         target = icon.scenePos() + QPointF(dx * GRID_SIZE, dy * GRID_SIZE)
 
         return CardinalDirectionConnector(icon, target_pos=target, border=True, exit_val=exit_val)
-
-    def _add_pan_anchors(self):
-        scene = self.map.scene()
-        size = 1
-        distance = self.ANCHOR_DISTANCE
-
-        anchors = [
-            QPointF(-distance, -distance),
-            QPointF(distance, -distance),
-            QPointF(-distance, distance),
-            QPointF(distance, distance),
-        ]
-
-        for pos in anchors:
-            anchor = QGraphicsRectItem(pos.x(), pos.y(), size, size)
-            anchor.setVisible(False)
-            anchor.setFlag(QGraphicsRectItem.ItemIgnoresTransformations, True)
-            scene.addItem(anchor)
-            self._anchors.append(anchor)
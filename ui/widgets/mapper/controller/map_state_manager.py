@@ -2,9 +2,12 @@
 
 import os
 import pickle
+import threading
+
+from PySide6.QtCore import QRunnable, QThreadPool
+
 from ui.widgets.mapper.controller.map_graph import MapGraph
-from ui.widgets.mapper.utils import split_suffix
-from ui.widgets.mapper.constants import TEXT_TO_NUM
+from ui.widgets.mapper.constants import SUFFIXED_TEXT_TO_NUM
 
 
 class MapStateManager:
@@ -12,10 +15,13 @@ class MapStateManager:
         self.profile_path = profile_path or os.path.expanduser("~/.skald/default")
         self.map_file_path = os.path.join(self.profile_path, "map.pickle")
         self.global_graph = self._load_map() or MapGraph()
-        self.local_graph = MapGraph()
 
         self.current_room = None
         self.prev_links = {}
+        self.prev_links_rev = {}
+
+        # Serializes the tmp-file write when saves overlap
+        self._save_lock = threading.Lock()
 
     def _load_map(self):
         try:
@@ -27,20 +33,41 @@ class MapStateManager:
         return None
 
     def save_map(self):
+        # Snapshot on the GUI thread (GMCP handlers mutate the graph there),
+        # then hand the blocking file I/O to the global thread pool.
+        try:
+            data = pickle.dumps(self.global_graph, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Error saving map: {e}")
+            return
+        QThreadPool.globalInstance().start(QRunnable.create(lambda: self._write_map(data)))
+
+    def _write_map(self, data: bytes):
         try:
-            os.makedirs(self.profile_path, exist_ok=True)
-            tmp_path = self.map_file_path + ".tmp"
-            with open(tmp_path, "wb") as f:
-                pickle.dump(self.global_graph, f, protocol=pickle.HIGHEST_PROTOCOL) # type: ignore
-            os.replace(tmp_path, self.map_file_path)
+            with self._save_lock:
+                os.makedirs(self.profile_path, exist_ok=True)
+                tmp_path = self.map_file_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                    # Flush to disk before the rename: otherwise a crash can
+                    # promote a truncated pickle and _load_map would discard
+                    # the whole explored map.
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.map_file_path)
         except Exception as e:
             print(f"Error saving map: {e}")
 
     def update_links_before_change(self):
+        # Hold a reference, not a copy: room updates replace the links dict
+        # wholesale, so the previous dict stays intact for get_move_code.
         if self.current_room and self.global_graph.has_room(self.current_room):
-            self.prev_links = dict(self.global_graph.get_room(self.current_room).links)
+            room = self.global_graph.get_room(self.current_room)
+            self.prev_links = room.links
+            self.prev_links_rev = room.links_rev
         else:
-            self.prev_links.clear()
+            self.prev_links = {}
+            self.prev_links_rev = {}
 
     def add_or_update_room(self, info):
         self.global_graph.add_or_update_room(info, exit_types=info.get("exits", {}))
@@ -49,5 +76,5 @@ class MapStateManager:
     def get_move_code(self, new_hash):
         if not self.current_room:
             return None
-        direction = next((d for d, dst in self.prev_links.items() if dst == new_hash), None)
-        return TEXT_TO_NUM.get(split_suffix(direction)[0]) if direction else None
+        direction = self.prev_links_rev.get(new_hash)
+        return SUFFIXED_TEXT_TO_NUM.get(direction.lower()) if direction else None
@@ -1,20 +1,67 @@
 # core/mapper/room.py
+import sys
 from typing import Dict
 
+from ui.widgets.mapper.constants import SUFFIXED_TEXT_TO_DELTA
+
+_NON_CARDINAL = frozenset(("in", "out", "up", "down"))
+
 
 class Room:
-    __slots__ = ("hash", "desc", "terrain", "links", "icon", "graph_ref", "grid_x", "grid_y")
+    __slots__ = ("hash", "desc", "terrain", "links", "_non_cardinal_tags",
+                 "_links_rev", "_layout_exits", "icon", "graph_ref",
+                 "grid_x", "grid_y")
 
     def __init__(self, info: dict):
-        self.hash = info.get("hash")
+        room_hash = info.get("hash")
+        self.hash = sys.intern(room_hash) if room_hash else room_hash
         self.desc = info.get("short", "no description")
         self.terrain = info.get("type", -1)
         self.links: Dict[str, str] = info.get("links", {})
+        self._non_cardinal_tags = None
+        self._links_rev = None
+        self._layout_exits = None
         self.icon = None  # QGraphicsItem reference
         self.graph_ref = None  # Optional reference to MapGraph
         self.grid_x = 0
         self.grid_y = 0
 
+    @property
+    def non_cardinal_tags(self) -> tuple:
+        """Cached (in/out/up/down) link tags; recomputed after links change."""
+        tags = getattr(self, "_non_cardinal_tags", None)
+        if tags is None:
+            tags = tuple(d for d in (x.lower() for x in self.links) if d in _NON_CARDINAL)
+            self._non_cardinal_tags = tags
+        return tags
+
+    @property
+    def links_rev(self) -> Dict[str, str]:
+        """Cached destination-hash → direction map; recomputed after links change."""
+        rev = getattr(self, "_links_rev", None)
+        if rev is None:
+            rev = {dest: d for d, dest in self.links.items() if dest}
+            self._links_rev = rev
+        return rev
+
+    @property
+    def layout_exits(self) -> tuple:
+        """Cached (dest_hash, dx, dy) triples for the grid-placeable links.
+
+        Links rarely change after a room is first seen, while layout walks
+        them on every BFS visit — resolving direction text to deltas once
+        per change saves the per-visit suffix/table lookups.
+        """
+        exits = getattr(self, "_layout_exits", None)
+        if exits is None:
+            exits = tuple(
+                (sys.intern(dest), delta[0], delta[1])
+                for d, dest in self.links.items()
+                if dest and (delta := SUFFIXED_TEXT_TO_DELTA.get(d.lower()))
+            )
+            self._layout_exits = exits
+        return exits
+
     @property
     def explored(self) -> bool:
         return self.terrain != -1
@@ -24,6 +71,9 @@ class Room:
         self.desc = info.get("short", self.desc)
         self.terrain = info.get("type", self.terrain)
         self.links = info.get("links", self.links)
+        self._non_cardinal_tags = None
+        self._links_rev = None
+        self._layout_exits = None
 
         if self.icon:
             self.icon.setToolTip(self.desc)
@@ -32,10 +82,7 @@ class Room:
 
     def direction_to(self, other: 'Room') -> str | None:
         """Returns the direction name from this room to another, if known."""
-        for dir_name, dest_hash in self.links.items():
-            if dest_hash == other.hash:
-                return dir_name
-        return None
+        return self.links_rev.get(other.hash)
 
     def to_dict(self) -> dict:
         return {
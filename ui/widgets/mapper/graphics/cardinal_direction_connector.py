@@ -25,6 +25,7 @@ class CardinalDirectionConnector(QGraphicsItem):
     _COLOR_CONNECTOR = Qt.darkGray
     _COLOR_BORDER    = QColor("orange")
     _COLOR_HOVER     = Qt.cyan
+    _PEN_NONE        = QPen(Qt.NoPen)
 
     # Arrow geometry
     _ARROW_SIZE = 8
@@ -83,6 +84,12 @@ class CardinalDirectionConnector(QGraphicsItem):
         # graphics setup
         self.setZValue(Z_CONNECTOR)
         self.setAcceptHoverEvents(True)
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)  # children paint themselves
+
+        # memoized hit-testing stroke (rebuilt only when the line changes)
+        self._shape_cache = None
+        self._shape_key = None
+        self._bounding_rect = None
 
         # connector line
         self.line_item = QGraphicsLineItem(self)
@@ -110,6 +117,8 @@ class CardinalDirectionConnector(QGraphicsItem):
         scene.addItem(self)
 
     def refresh(self):
+        self.prepareGeometryChange()
+        self._bounding_rect = None
         p1 = self.icon_a.scenePos()
         p2 = self.icon_b.scenePos() if self.icon_b else self.target_pos
         line = QLineF(p1, p2)
@@ -128,7 +137,7 @@ class CardinalDirectionConnector(QGraphicsItem):
             rot_off = self._DOOR_ROT[ev]
             self.door_item.setRect(self._DOOR_RECT)
             self.door_item.setBrush(brush)
-            self.door_item.setPen(QPen(Qt.NoPen))
+            self.door_item.setPen(self._PEN_NONE)
             self.door_item.setRotation(angle + rot_off)
             pos = line.p2() if self.border else line.center()
             self.door_item.setPos(pos)
@@ -141,18 +150,28 @@ class CardinalDirectionConnector(QGraphicsItem):
             else:
                 self.arrow_item.setPolygon(QPolygonF())
 
+        self._shape_key = None
+
     def boundingRect(self) -> QRectF:
-        return self.childrenBoundingRect().adjusted(-6, -6, 6, 6)
+        if self._bounding_rect is None:
+            self._bounding_rect = self.childrenBoundingRect().adjusted(-6, -6, 6, 6)
+        return self._bounding_rect
 
     def shape(self) -> QPainterPath:
-        path = QPainterPath()
         ln = self.line_item.line()
+        key = (ln.x1(), ln.y1(), ln.x2(), ln.y2(), self._pen_normal.widthF())
+        if key == self._shape_key:
+            return self._shape_cache
+
+        path = QPainterPath()
         path.moveTo(ln.p1())
         path.lineTo(ln.p2())
 
         stroker = QPainterPathStroker()
         stroker.setWidth(self._pen_normal.widthF() + 8)
-        return stroker.createStroke(path)
+        self._shape_cache = stroker.createStroke(path)
+        self._shape_key = key
+        return self._shape_cache
 
     def hoverEnterEvent(self, event):
         self.line_item.setPen(self._pen_hover)
@@ -165,7 +184,7 @@ class CardinalDirectionConnector(QGraphicsItem):
     def hoverLeaveEvent(self, event):
         self.line_item.setPen(self._pen_normal)
         if self.door_item:
-            self.door_item.setPen(QPen(Qt.NoPen))
+            self.door_item.setPen(self._PEN_NONE)
         if self.arrow_item:
             self.arrow_item.setPen(self._pen_normal)
         super().hoverLeaveEvent(event)
@@ -2,18 +2,30 @@
 
 import math
 
-from PySide6.QtCore import QPointF, Qt
-from PySide6.QtGui import QPen, QBrush, QColor, QPolygonF
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QPen, QBrush, QColor, QPolygonF, QPainter, QPixmap
 from PySide6.QtWidgets import (
-    QGraphicsItemGroup, QGraphicsEllipseItem,
-    QGraphicsPolygonItem, QGraphicsDropShadowEffect
+    QGraphicsEllipseItem, QGraphicsPixmapItem,
+    QGraphicsPolygonItem, QGraphicsDropShadowEffect, QGraphicsScene
 )
 
 from ui.widgets.mapper.constants import GRID_SIZE, Z_ROOM_ICON, NUM_TO_DELTA
 
+_INV_SQRT2 = 1 / math.sqrt(2)
 
-class LocationWidget(QGraphicsItemGroup):
-    """Displays the player location as a circle with an optional directional arrow."""
+
+class LocationWidget(QGraphicsPixmapItem):
+    """
+    Displays the player location as a circle with an optional directional
+    arrow. The whole widget is one sprite: nine pixmap variants (circle only,
+    plus circle+arrow per direction code) are baked once with their drop
+    shadows, so updates are a pixmap swap and repaints a single blit.
+    """
+
+    _SHADOW_COLOR = QColor(0, 0, 0, 160)
+    _CIRCLE_PEN = QPen(QColor("red"), 5)
+    _ARROW_PEN = QPen(QColor("red"))
+    _ARROW_BRUSH = QBrush(QColor("red"))
 
     def __init__(self, grid_x, grid_y, direction_code=None,
                  radius=16, arrow_length=8, arrow_width=8):
@@ -23,59 +35,35 @@ class LocationWidget(QGraphicsItemGroup):
         self.arrow_length = arrow_length
         self.arrow_width = arrow_width
 
-        self._init_circle()
-        self._init_arrow()
+        # (pixmap, top_left) per direction code, None = circle without arrow
+        self._variants = self._bake_variants()
+        self._code = object()  # sentinel: no variant applied yet
 
         self.setZValue(Z_ROOM_ICON + 1)
         self.update_position(grid_x, grid_y)
         self.update_direction(direction_code)
 
-    def _init_circle(self):
-        """Creates the red circular location marker."""
+    def _bake_variants(self):
+        circle = self._bake_circle()
+        variants = {None: circle}
+        for code in NUM_TO_DELTA:
+            variants[code] = self._compose(circle, self._bake_arrow(code))
+        return variants
+
+    def _bake_circle(self):
+        """Bakes the red circular marker with its shadow."""
         r = self.radius
         circle = QGraphicsEllipseItem(-r, -r, r * 2, r * 2)
-        circle.setPen(QPen(QColor("red"), 5))
+        circle.setPen(self._CIRCLE_PEN)
         circle.setBrush(Qt.NoBrush)
-        circle.setGraphicsEffect(self._make_shadow(blur=12, offset=(4, 4)))
-        self.addToGroup(circle)
-
-    def _init_arrow(self):
-        """Creates the optional directional arrow."""
-        self.arrow = QGraphicsPolygonItem(QPolygonF())
-        self.arrow.setBrush(QBrush(QColor("red")))
-        self.arrow.setPen(QPen(QColor("red")))
-        self.arrow.setGraphicsEffect(self._make_shadow(blur=8, offset=(3, 3)))
-        self.arrow.setVisible(False)
-        self.addToGroup(self.arrow)
+        return self._bake_with_shadow(circle, blur=12, offset=(4, 4))
 
-    @staticmethod
-    def _make_shadow(blur, offset):
-        """Returns a black drop shadow effect."""
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(blur)
-        shadow.setOffset(offset[0], offset[1])
-        shadow.setColor(QColor(0, 0, 0, 160))
-        return shadow
-
-    def update_position(self, grid_x, grid_y):
-        """Moves the widget to the specified grid cell."""
-        self.setPos(QPointF(grid_x * GRID_SIZE, grid_y * GRID_SIZE))
-
-    def update_direction(self, code):
-        """Updates the arrow to point in the direction represented by `code`."""
-        direction = NUM_TO_DELTA.get(code)
-        if not direction:
-            self.arrow.setVisible(False)
-            return
-
-        dx, dy = direction
-        length = math.hypot(dx, dy)
-        if length == 0:
-            self.arrow.setVisible(False)
-            return
-
-        # Normalize vector
-        ux, uy = dx / length, dy / length
+    def _bake_arrow(self, code):
+        """Bakes the directional arrow with its shadow for a direction code."""
+        dx, dy = NUM_TO_DELTA[code]
+        # Deltas are all 0/±1, so no need for math.hypot's overflow care
+        inv = _INV_SQRT2 if dx and dy else 1.0
+        ux, uy = dx * inv, dy * inv
 
         # Points: tip, base left, base right
         tip = QPointF(ux * self.radius, uy * self.radius)
@@ -89,6 +77,72 @@ class LocationWidget(QGraphicsItemGroup):
         left = QPointF(base_center.x() + px * half_w, base_center.y() + py * half_w)
         right = QPointF(base_center.x() - px * half_w, base_center.y() - py * half_w)
 
-        # Set polygon and show
-        self.arrow.setPolygon(QPolygonF([tip, left, right]))
-        self.arrow.setVisible(True)
+        polygon = QGraphicsPolygonItem(QPolygonF([tip, left, right]))
+        polygon.setBrush(self._ARROW_BRUSH)
+        polygon.setPen(self._ARROW_PEN)
+
+        return self._bake_with_shadow(polygon, blur=8, offset=(3, 3))
+
+    @classmethod
+    def _bake_with_shadow(cls, item, blur, offset):
+        """
+        Renders `item` plus a drop shadow into a pixmap, once. The expensive
+        blur convolution happens here instead of on every repaint.
+        Returns (pixmap, top_left) where top_left positions the pixmap so the
+        item's local origin stays at this widget's origin.
+        """
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(blur)
+        shadow.setOffset(offset[0], offset[1])
+        shadow.setColor(cls._SHADOW_COLOR)
+        item.setGraphicsEffect(shadow)
+
+        scene = QGraphicsScene()
+        scene.addItem(item)
+
+        margin = blur + max(abs(offset[0]), abs(offset[1]))
+        rect = item.boundingRect().adjusted(-margin, -margin, margin, margin)
+
+        pixmap = QPixmap(math.ceil(rect.width()), math.ceil(rect.height()))
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        scene.render(painter, QRectF(pixmap.rect()), rect)
+        painter.end()
+
+        scene.removeItem(item)
+        return pixmap, rect.topLeft()
+
+    @staticmethod
+    def _compose(*layers):
+        """Merges baked (pixmap, top_left) layers into one sprite."""
+        rect = QRectF()
+        for pixmap, top_left in layers:
+            rect |= QRectF(top_left, pixmap.size().toSizeF())
+
+        combined = QPixmap(math.ceil(rect.width()), math.ceil(rect.height()))
+        combined.fill(Qt.transparent)
+        painter = QPainter(combined)
+        for pixmap, top_left in layers:
+            painter.drawPixmap(top_left - rect.topLeft(), pixmap)
+        painter.end()
+
+        return combined, rect.topLeft()
+
+    def update_position(self, grid_x, grid_y):
+        """Moves the widget to the specified grid cell."""
+        self.setPos(QPointF(grid_x * GRID_SIZE, grid_y * GRID_SIZE))
+
+    def update_direction(self, code):
+        """Updates the arrow to point in the direction represented by `code`."""
+        if code == self._code:
+            return
+        self._code = code
+        pixmap, top_left = self._variants.get(code, self._variants[None])
+        self.setPixmap(pixmap)
+        self.setOffset(top_left)
+
+    def update_state(self, grid_x, grid_y, code):
+        """Moves and re-aims the marker in one call."""
+        self.update_position(grid_x, grid_y)
+        self.update_direction(code)
@@ -15,9 +15,10 @@ class NonCardinalDirectionConnector(QGraphicsItemGroup):
     _PEN_LINE = QPen(_COLOR, 3)
     _PEN_CIRCLE = QPen(_COLOR, 2)
 
-    def __init__(self, icon, directions: list[str]):
+    def __init__(self, icon, directions):
         super().__init__()
         self.setZValue(Z_ROOM_ICON)
+        self.directions = tuple(directions)
 
         center = icon.mapToScene(icon.boundingRect().center())
         cx, cy = center.x(), center.y()
@@ -1,9 +1,10 @@
 from typing import List, Tuple, Optional
-from math import sqrt
+from math import sqrt, atan2, cos, sin, pi
 
 from PySide6.QtCore import QRectF, Qt, QPointF
 from PySide6.QtGui import (
-    QBrush, QPen, QColor, QFontMetrics, QPainter
+    QBrush, QPen, QColor, QFontMetrics, QPainter, QPainterPath, QPixmap,
+    QPixmapCache, QPolygonF
 )
 from PySide6.QtWidgets import (
     QGraphicsItem, QStyleOptionGraphicsItem, QWidget
@@ -14,12 +15,32 @@ from ui.widgets.mapper.utils import get_bold_font, get_terrain_color
 from game.terrain import TERRAIN_TYPES
 
 
+def _build_diamond_polys(vectors, offset, size):
+    """One diamond polygon per octant. Lives at module level because a
+    comprehension in a class body cannot see other class attributes."""
+    return tuple(
+        QPolygonF([
+            QPointF(dx * offset, dy * offset - size),
+            QPointF(dx * offset + size, dy * offset),
+            QPointF(dx * offset, dy * offset + size),
+            QPointF(dx * offset - size, dy * offset),
+        ])
+        for dx, dy in vectors
+    )
+
+
 class RoomIcon(QGraphicsItem):
     _HALF = ROOM_SIZE / 2
     _PAD = 2
     _DIAMOND_SIZE = 8
     _DIAMOND_OFFSET = _HALF + _DIAMOND_SIZE
 
+    # Integer variants so paints hit the int drawRect/drawEllipse overloads
+    # without per-call round()
+    _HALF_I = ROOM_SIZE // 2
+    _OFF_I = -_HALF_I - _PAD
+    _SIZE_TOTAL_I = ROOM_SIZE + 2 * _PAD
+
     # Brushes and pens
     _terrain_brushes = {
         code: QBrush(get_terrain_color(name))
@@ -31,10 +52,23 @@ class RoomIcon(QGraphicsItem):
     _border_pen = QPen(Qt.darkGray, 1)
     _sel_pen = QPen(Qt.cyan, 2)
     _sel_brush = QBrush(QColor(0, 255, 255, 60))
+    _no_pen = QPen(Qt.NoPen)
+    _diamond_brush = QBrush(QColor("orange"))
+    _hover_pen = QPen(Qt.yellow, 2, Qt.DashLine)
+    _hover_brush = QBrush(QColor(255, 255, 0, 40))  # translucent yellow
 
     _qmark_font = get_bold_font(ROOM_SIZE * 0.5)
     _qmark_metrics = QFontMetrics(_qmark_font)
 
+    # Unit vectors for the 8 compass octants the exit diamond snaps to,
+    # and one pre-built diamond polygon per octant
+    _OCTANT_VECTORS = tuple(
+        (cos(k * pi / 4), sin(k * pi / 4)) for k in range(8)
+    )
+    _DIAMOND_POLYS = _build_diamond_polys(
+        _OCTANT_VECTORS, _DIAMOND_OFFSET, _DIAMOND_SIZE
+    )
+
     def __init__(self, room_hash: str, grid_x: int, grid_y: int, short_desc: str, terrain: int):
         super().__init__()
         self.grid_x = grid_x
@@ -42,8 +76,10 @@ class RoomIcon(QGraphicsItem):
         self.terrain = terrain  # -1 = unexplored, 0–13 = known
         self.room_hash = room_hash
         self.exit_vectors: List[Tuple[float, float]] = []
+        self._primary_cache: Optional[Tuple[float, float]] = None
 
         self.setToolTip(short_desc)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setAcceptedMouseButtons(Qt.AllButtons)
         self.setAcceptHoverEvents(True)
@@ -51,92 +87,152 @@ class RoomIcon(QGraphicsItem):
         self.setFlag(QGraphicsItem.ItemIsFocusable, True)
 
         self.setZValue(Z_ROOM_SHAPE + 1)
-        self.setPos(grid_x * GRID_SIZE, grid_y * GRID_SIZE)
+        self.setPos(QPointF(grid_x * GRID_SIZE, grid_y * GRID_SIZE))
+
+        # Render once to an off-screen pixmap; repaints during pan are blits.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         self.setAcceptHoverEvents(True)
         self._hovered = False
 
     def boundingRect(self) -> QRectF:
-        size = ROOM_SIZE + self._PAD * 2
-        offset = -self._HALF - self._PAD
-        return QRectF(offset, offset, size, size)
+        # Wide enough to cover the exit diamond, which sits outside the room
+        # square; cached rendering clips anything painted beyond this rect.
+        reach = self._DIAMOND_OFFSET + self._DIAMOND_SIZE
+        return QRectF(-reach, -reach, reach * 2, reach * 2)
+
+    def shape(self) -> QPainterPath:
+        # Interaction (hover, clicks, scene queries) stays on the room
+        # square; the enlarged boundingRect above exists only so the cached
+        # rendering covers the exit diamond.
+        path = QPainterPath()
+        path.addRect(self._overlay_rect())
+        return path
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: Optional[QWidget] = None):
-        if self.terrain == -1:
-            self._paint_unexplored(painter)
+        octant = self._diamond_octant() if self.exit_vectors else None
+        pixmap = self._pixmap_for(self.terrain, self.isSelected(), octant)
+
+        # Blit only the exposed portion of the cached pixmap
+        exposed = option.exposedRect
+        top_left = self.boundingRect().topLeft()
+        painter.drawPixmap(exposed.topLeft(), pixmap, exposed.translated(-top_left))
+
+        if self._hovered and exposed.intersects(self._overlay_rect()):
+            self._paint_hover_overlay(painter)
+
+    @classmethod
+    def _overlay_rect(cls) -> QRectF:
+        return QRectF(cls._OFF_I, cls._OFF_I, cls._SIZE_TOTAL_I, cls._SIZE_TOTAL_I)
+
+    @classmethod
+    def _pixmap_for(cls, terrain: int, selected: bool, octant: Optional[int]) -> QPixmap:
+        """
+        Returns a shared pixmap for the given visual state. Visually identical
+        rooms all blit the same pre-rendered pixmap instead of re-running the
+        vector drawing sequence per paint.
+        """
+        key = f"RoomIcon:{terrain}:{int(selected)}:{octant}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap:
+            return pixmap
+
+        reach = cls._DIAMOND_OFFSET + cls._DIAMOND_SIZE
+        size = round(reach * 2)
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(reach, reach)
+
+        if terrain == -1:
+            cls._paint_unexplored(painter)
         else:
-            self._paint_terrain(painter)
+            cls._paint_terrain(painter, terrain)
 
-        if self.isSelected():
-            self._paint_selection_overlay(painter)
+        if selected:
+            cls._paint_selection_overlay(painter, terrain)
 
-        if self.exit_vectors:
-            self._paint_exit_diamond(painter)
+        if octant is not None:
+            cls._paint_exit_diamond(painter, octant)
 
-        if self._hovered:
-            self._paint_hover_overlay(painter)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _diamond_octant(self) -> int:
+        """Quantizes the primary exit vector to one of 8 compass octants."""
+        ux, uy = self.primary_exit_unit_vector()
+        return round(atan2(uy, ux) / (pi / 4)) % 8
 
-    def _paint_unexplored(self, painter: QPainter):
-        painter.setBrush(self._unexplored_brush)
-        painter.setPen(self._border_pen)
-        painter.drawEllipse(round(-self._HALF), round(-self._HALF), ROOM_SIZE, ROOM_SIZE)
+    @classmethod
+    def _paint_unexplored(cls, painter: QPainter):
+        painter.setBrush(cls._unexplored_brush)
+        painter.setPen(cls._border_pen)
+        painter.drawEllipse(-cls._HALF_I, -cls._HALF_I, ROOM_SIZE, ROOM_SIZE)
 
-        painter.setFont(self._qmark_font)
+        painter.setFont(cls._qmark_font)
         painter.setPen(Qt.gray)
         qm = "?"
-        br = self._qmark_metrics.boundingRect(qm)
+        br = cls._qmark_metrics.boundingRect(qm)
         x = - (br.x() + br.width() / 2)
         y = - (br.y() + br.height() / 2)
         painter.drawText(round(x), round(y), qm)
 
-    def _paint_terrain(self, painter: QPainter):
-        brush = self._terrain_brushes.get(self.terrain, self._default_brush)
+    @classmethod
+    def _paint_terrain(cls, painter: QPainter, terrain: int):
+        brush = cls._terrain_brushes.get(terrain, cls._default_brush)
         painter.setBrush(brush)
         painter.setPen(Qt.NoPen)
-        painter.drawRect(round(-self._HALF), round(-self._HALF), ROOM_SIZE, ROOM_SIZE)
-
-    def _paint_selection_overlay(self, painter: QPainter):
-        painter.setPen(self._sel_pen)
-        painter.setBrush(self._sel_brush)
-        size = ROOM_SIZE + self._PAD * 2
-        offset = -self._HALF - self._PAD
-        if self.terrain == -1:
-            painter.drawEllipse(round(offset), round(offset), size, size)
+        painter.drawRect(-cls._HALF_I, -cls._HALF_I, ROOM_SIZE, ROOM_SIZE)
+
+    @classmethod
+    def _paint_selection_overlay(cls, painter: QPainter, terrain: int):
+        painter.setPen(cls._sel_pen)
+        painter.setBrush(cls._sel_brush)
+        if terrain == -1:
+            painter.drawEllipse(cls._OFF_I, cls._OFF_I, cls._SIZE_TOTAL_I, cls._SIZE_TOTAL_I)
         else:
-            painter.drawRect(round(offset), round(offset), size, size)
-
-    def _paint_exit_diamond(self, painter: QPainter):
-        dx, dy = self.primary_exit_unit_vector()
-        cx = dx * self._DIAMOND_OFFSET
-        cy = dy * self._DIAMOND_OFFSET
+            painter.drawRect(cls._OFF_I, cls._OFF_I, cls._SIZE_TOTAL_I, cls._SIZE_TOTAL_I)
 
-        painter.setBrush(QColor("orange"))
-        painter.setPen(Qt.NoPen)
-        s = self._DIAMOND_SIZE
-        points = [
-            QPointF(cx, cy - s),
-            QPointF(cx + s, cy),
-            QPointF(cx, cy + s),
-            QPointF(cx - s, cy)
-        ]
-        painter.drawPolygon(points)
+    @classmethod
+    def _paint_exit_diamond(cls, painter: QPainter, octant: int):
+        painter.setBrush(cls._diamond_brush)
+        painter.setPen(cls._no_pen)
+        painter.drawPolygon(cls._DIAMOND_POLYS[octant])
 
     # ─── Multi-exit support ─────────────────────────────────────────────
 
     def reset_exit_vectors(self) -> None:
         self.exit_vectors.clear()
+        self._primary_cache = None
+        self.update()
 
     def add_exit_vector(self, ux: float, uy: float) -> None:
         self.exit_vectors.append((ux, uy))
+        self._primary_cache = None
+        self.update()
 
     def primary_exit_unit_vector(self) -> Tuple[float, float]:
+        if self._primary_cache is not None:
+            return self._primary_cache
+
         if not self.exit_vectors:
             return 0.0, -1.0
 
-        sx = sum(x for x, _ in self.exit_vectors)
-        sy = sum(y for _, y in self.exit_vectors)
+        sx = sy = 0.0
+        for x, y in self.exit_vectors:
+            sx += x
+            sy += y
+
         length = sqrt(sx * sx + sy * sy)
-        return (sx / length, sy / length) if length else (0.0, -1.0)
+        if length:
+            inv = 1.0 / length
+            self._primary_cache = (sx * inv, sy * inv)
+        else:
+            self._primary_cache = (0.0, -1.0)
+        return self._primary_cache
 
     def hoverEnterEvent(self, event):
         self._hovered = True
@@ -147,16 +243,10 @@ class RoomIcon(QGraphicsItem):
         self.update()
 
     def _paint_hover_overlay(self, painter: QPainter):
-        hover_pen = QPen(Qt.yellow, 2, Qt.DashLine)
-        hover_brush = QBrush(QColor(255, 255, 0, 40))  # translucent yellow
-
-        painter.setPen(hover_pen)
-        painter.setBrush(hover_brush)
-
-        size = ROOM_SIZE + self._PAD * 2
-        offset = -self._HALF - self._PAD
+        painter.setPen(self._hover_pen)
+        painter.setBrush(self._hover_brush)
 
         if self.terrain == -1:
-            painter.drawEllipse(round(offset), round(offset), size, size)
+            painter.drawEllipse(self._OFF_I, self._OFF_I, self._SIZE_TOTAL_I, self._SIZE_TOTAL_I)
         else:
-            painter.drawRect(round(offset), round(offset), size, size)
+            painter.drawRect(self._OFF_I, self._OFF_I, self._SIZE_TOTAL_I, self._SIZE_TOTAL_I)
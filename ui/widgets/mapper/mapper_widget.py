@@ -18,8 +18,16 @@ class MapperWidget(QGraphicsView):
         super().__init__(parent)
 
         self._scene = QGraphicsScene(self)
+        # Items are torn down and re-added every render; BSP re-indexing costs
+        # more than the linear lookups it would save on a local map this size.
+        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self._scene)
         self.setRenderHint(QPainter.Antialiasing)
+        # Repaint dirty regions only, and skip painter state bookkeeping Qt
+        # does for items that restore state themselves
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setCacheMode(QGraphicsView.CacheBackground)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
@@ -102,6 +110,7 @@ class MapperWidget(QGraphicsView):
     def _toggle_border(self, a_hash, b_hash, flag):
         self.controller.state.global_graph.set_border(a_hash, b_hash, flag)
         self.controller.render()
+        self.controller.mapUpdated.emit()
 
     def _delete_room(self, room_hash: str):
         graph = self.controller.state.global_graph